@@ -2,9 +2,17 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import json
 import os
+import atexit
+import gzip
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ==========================================
 # Color Scheme - Modern Dark Theme
 # ==========================================
@@ -22,21 +30,79 @@ COLORS = {
     'border': '#4a4a6a'
 }
 
+# Delay before pending changes are written to disk
+SAVE_DELAY_MS = 5000
+# Fast compression; the data file is small and written often
+GZIP_LEVEL = 1
+# How often the GUI checks whether the background load has finished
+LOAD_POLL_MS = 50
+
+# ==========================================
+# JSON Helpers (orjson when available)
+# ==========================================
+def dump_json(data):
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # orjson only handles 64-bit integers; stdlib json has no limit
+            pass
+    return json.dumps(data).encode('utf-8')
+
+def parse_int(text):
+    # Form numbers must fit in 64 bits, or orjson would load them back as floats
+    value = int(text)
+    if not -2**63 <= value < 2**63:
+        raise ValueError("number out of range")
+    return value
+
+def load_json(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # ==========================================
 # Library Item Classes (Same logic as C++)
 # ==========================================
 class LibraryItem(ABC):
+    __slots__ = ('id', 'title', 'is_borrowed', '_title_lower', '_dict_cache', '_json_bytes')
+    
     def __init__(self, item_id, title):
-        self.id = item_id
+        # Inventory is keyed by int IDs, whatever the source (form, JSON)
+        self.id = int(item_id)
         self.title = title
+        self._title_lower = str(title).casefold()
         self.is_borrowed = False
+        self._dict_cache = None
+        self._json_bytes = None
+    
+    def set_title(self, title):
+        self.title = title
+        self._title_lower = str(title).casefold()
+        self._invalidate()
+    
+    def _invalidate(self):
+        self._dict_cache = None
+        self._json_bytes = None
+    
+    def to_dict(self):
+        # Cached until the item is mutated; callers must not modify the result
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+    
+    def to_json_bytes(self):
+        # Encoded JSON fragment, cached alongside to_dict
+        if self._json_bytes is None:
+            self._json_bytes = dump_json(self.to_dict())
+        return self._json_bytes
     
     @abstractmethod
     def get_type(self):
         pass
     
     @abstractmethod
-    def to_dict(self):
+    def _build_dict(self):
         pass
     
     @abstractmethod
@@ -44,6 +110,8 @@ class LibraryItem(ABC):
         pass
 
 class Book(LibraryItem):
+    __slots__ = ('author', 'pages')
+    
     def __init__(self, item_id, title, author, pages):
         super().__init__(item_id, title)
         self.author = author
@@ -52,7 +120,7 @@ class Book(LibraryItem):
     def get_type(self):
         return "BOOK"
     
-    def to_dict(self):
+    def _build_dict(self):
         return {
             'type': 'BOOK',
             'id': self.id,
@@ -73,6 +141,8 @@ class Book(LibraryItem):
         }
 
 class Journal(LibraryItem):
+    __slots__ = ('publisher', 'volume')
+    
     def __init__(self, item_id, title, publisher, volume):
         super().__init__(item_id, title)
         self.publisher = publisher
@@ -81,7 +151,7 @@ class Journal(LibraryItem):
     def get_type(self):
         return "JOURNAL"
     
-    def to_dict(self):
+    def _build_dict(self):
         return {
             'type': 'JOURNAL',
             'id': self.id,
@@ -104,82 +174,242 @@ class Journal(LibraryItem):
 # ==========================================
 # Library Manager (Backend Logic)
 # ==========================================
+# Shared (success, message) results returned by the manager
+ADD_OK = (True, "Item added successfully")
+ADD_DUPLICATE = (False, "ID already exists!")
+REMOVE_OK = (True, "Item removed successfully")
+TOGGLE_BORROWED = (True, "Status updated to: Borrowed")
+TOGGLE_AVAILABLE = (True, "Status updated to: Available")
+ITEM_NOT_FOUND = (False, "Item not found")
+
 class LibraryManager:
-    def __init__(self):
+    def __init__(self, root=None):
         self.inventory = {}
-        self.filename = "library_data.json"
-        self.load_from_file()
+        self.filename = "library_data.json.gz"
+        self.legacy_filename = "library_data.json"
+        self.root = root
+        self._borrowed = 0
+        self._dirty = False
+        self._flush_job = None
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_write = None
+        self._last_source = None
+        self._load_future = None
+        if root is None:
+            self.load_from_file()
+        else:
+            # Parse on the I/O thread so the window can appear immediately
+            self._load_future = self._io_pool.submit(self._read_file)
+        atexit.register(self.flush_if_dirty, True)
     
     def add_item(self, item):
+        self._ensure_loaded()
         if item.id in self.inventory:
-            return False, "ID already exists!"
+            return ADD_DUPLICATE
         self.inventory[item.id] = item
-        self.save_to_file()
-        return True, "Item added successfully"
+        if item.is_borrowed:
+            self._borrowed += 1
+        self._mark_dirty()
+        return ADD_OK
     
     def remove_item(self, item_id):
+        self._ensure_loaded()
         if item_id in self.inventory:
-            del self.inventory[item_id]
-            self.save_to_file()
-            return True, "Item removed successfully"
-        return False, "Item not found"
+            item = self.inventory.pop(item_id)
+            if item.is_borrowed:
+                self._borrowed -= 1
+            self._mark_dirty()
+            return REMOVE_OK
+        return ITEM_NOT_FOUND
     
     def search_items(self, keyword):
-        results = []
-        for item in self.inventory.values():
-            if keyword.lower() in item.title.lower():
-                results.append(item)
-        return results
+        self._ensure_loaded()
+        keyword = keyword.casefold()
+        return [item for item in self.inventory.values() if keyword in item._title_lower]
     
     def toggle_borrow(self, item_id):
+        self._ensure_loaded()
         if item_id in self.inventory:
             item = self.inventory[item_id]
+            item._invalidate()
             item.is_borrowed = not item.is_borrowed
-            self.save_to_file()
-            return True, f"Status updated to: {'Borrowed' if item.is_borrowed else 'Available'}"
-        return False, "Item not found"
+            self._borrowed += 1 if item.is_borrowed else -1
+            self._mark_dirty()
+            return TOGGLE_BORROWED if item.is_borrowed else TOGGLE_AVAILABLE
+        return ITEM_NOT_FOUND
     
     def get_all_items(self):
-        return list(self.inventory.values())
+        self._ensure_loaded()
+        # View, no copy; only valid until the next reload replaces the inventory.
+        # Wrap in tuple() if the inventory may change mid-loop.
+        return self.inventory.values()
+    
+    def get_stats(self):
+        # (total, borrowed), kept up to date on every mutation
+        return len(self.inventory), self._borrowed
     
     def get_item(self, item_id):
+        self._ensure_loaded()
         return self.inventory.get(item_id)
     
+    def _mark_dirty(self):
+        # Without a Tk root there is no event loop to batch on, so save now
+        if self.root is None:
+            self.save_to_file()
+            return
+        
+        self._dirty = True
+        if self._flush_job is None:
+            self._flush_job = self.root.after(SAVE_DELAY_MS, self.flush_if_dirty)
+    
+    def flush_if_dirty(self, wait=False):
+        if self._flush_job is not None:
+            try:
+                self.root.after_cancel(self._flush_job)
+            except tk.TclError:
+                pass
+            self._flush_job = None
+        
+        if self._dirty:
+            self.save_to_file()
+            self._dirty = False
+        
+        if wait:
+            self.wait_for_writes()
+    
+    def wait_for_writes(self):
+        if self._pending_write is not None:
+            self._pending_write.result()
+            self._pending_write = None
+    
     def save_to_file(self):
-        data = [item.to_dict() for item in self.inventory.values()]
-        with open(self.filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        self._ensure_loaded()
+        # Serialize on the caller's thread, hand the disk I/O to the writer thread
+        # Only items changed since the last save are re-encoded
+        data = b'[' + b','.join(item.to_json_bytes() for item in self.inventory.values()) + b']'
+        try:
+            self._pending_write = self._io_pool.submit(self._write_bytes, data)
+        except RuntimeError:
+            # Executor is already shut down (interpreter exit), write inline
+            self._write_bytes(data)
+    
+    def _write_bytes(self, data):
+        try:
+            # Write to a temp file and swap it in so a crash never truncates the data
+            tmp_filename = self.filename + '.tmp'
+            with open(tmp_filename, 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=GZIP_LEVEL))
+            os.replace(tmp_filename, self.filename)
+            # Our own write is not an external change worth reloading
+            self._last_source = (self.filename, os.path.getmtime(self.filename))
+        except Exception as e:
+            print(f"Error saving data: {e}")
+    
+    def reload_if_changed(self):
+        # Replaces self.inventory; GUI callers must refresh their views when this returns True
+        self._ensure_loaded()
+        # Unsaved in-memory changes take precedence over the file on disk
+        self.flush_if_dirty(wait=True)
+        
+        data_file = self._data_file()
+        if data_file is None:
+            return False
+        path = data_file[0]
+        try:
+            source = (path, os.path.getmtime(path))
+        except OSError:
+            return False
+        if source == self._last_source:
+            return False
+        
+        self.load_from_file()
+        return True
+    
+    def poll_loaded(self):
+        # Non-blocking check used by the GUI while the background load runs
+        if self._load_future is not None and self._load_future.done():
+            self._ensure_loaded()
+        return self._load_future is None
+    
+    def _ensure_loaded(self):
+        if self._load_future is not None:
+            future, self._load_future = self._load_future, None
+            self._install_inventory(*future.result())
+    
+    def _install_inventory(self, inventory, borrowed, source):
+        self.inventory = inventory
+        self._borrowed = borrowed
+        if source is not None:
+            self._last_source = source
     
     def load_from_file(self):
-        if not os.path.exists(self.filename):
-            return
+        self._install_inventory(*self._read_file())
+    
+    def _data_file(self):
+        # Prefer the gzipped file, falling back to the legacy plain JSON file
+        if os.path.exists(self.filename):
+            return self.filename, True
+        if os.path.exists(self.legacy_filename):
+            return self.legacy_filename, False
+        return None
+    
+    def _read_file(self):
+        # Builds a fresh inventory without touching self, so it can run off the Tk thread
+        inventory = {}
+        borrowed = 0
+        
+        data_file = self._data_file()
+        if data_file is None:
+            return inventory, borrowed, None
+        path, compressed = data_file
         
         try:
-            with open(self.filename, 'r') as f:
-                data = json.load(f)
+            stat = os.stat(path)
+            if stat.st_size == 0:
+                return inventory, borrowed, (path, stat.st_mtime)
+            
+            with open(path, 'rb') as f:
+                raw = f.read()
+            if compressed:
+                raw = gzip.decompress(raw)
+            data = load_json(raw)
             
             for item_data in data:
-                if item_data['type'] == 'BOOK':
-                    item = Book(
-                        item_data['id'],
-                        item_data['title'],
-                        item_data['author'],
-                        item_data['pages']
-                    )
-                elif item_data['type'] == 'JOURNAL':
-                    item = Journal(
-                        item_data['id'],
-                        item_data['title'],
-                        item_data['publisher'],
-                        item_data['volume']
-                    )
-                else:
+                # Skip malformed records (bad ID, missing field)
+                # rather than aborting the load and saving a partial inventory
+                try:
+                    if item_data['type'] == 'BOOK':
+                        item = Book(
+                            item_data['id'],
+                            item_data['title'],
+                            item_data['author'],
+                            item_data['pages']
+                        )
+                    elif item_data['type'] == 'JOURNAL':
+                        item = Journal(
+                            item_data['id'],
+                            item_data['title'],
+                            item_data['publisher'],
+                            item_data['volume']
+                        )
+                    else:
+                        continue
+                except (ValueError, TypeError, AttributeError, KeyError):
                     continue
                 
                 item.is_borrowed = item_data.get('is_borrowed', False)
-                self.inventory[item.id] = item
+                # A later record with the same ID replaces the earlier one
+                replaced = inventory.get(item.id)
+                if replaced is not None and replaced.is_borrowed:
+                    borrowed -= 1
+                inventory[item.id] = item
+                if item.is_borrowed:
+                    borrowed += 1
+            
+            return inventory, borrowed, (path, stat.st_mtime)
         except Exception as e:
             print(f"Error loading data: {e}")
+            return inventory, borrowed, None
 
 # ==========================================
 # Custom Styled Widgets
@@ -211,7 +441,38 @@ class ModernButton(tk.Button):
     def on_leave(self, e):
         self['bg'] = self.default_bg
 
+class SidebarButton(tk.Button):
+    NORMAL_BG = COLORS['bg_light']
+    HOVER_BG = COLORS['accent']
+    
+    def __init__(self, parent, text, command, **kwargs):
+        super().__init__(
+            parent,
+            text=text,
+            command=command,
+            bg=self.NORMAL_BG,
+            fg=COLORS['text'],
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            cursor='hand2',
+            anchor='w',
+            padx=20,
+            pady=15,
+            **kwargs
+        )
+        self.bind('<Enter>', self.on_enter)
+        self.bind('<Leave>', self.on_leave)
+    
+    def on_enter(self, e):
+        self['bg'] = self.HOVER_BG
+    
+    def on_leave(self, e):
+        self['bg'] = self.NORMAL_BG
+
 class ModernEntry(tk.Entry):
+    TEXT_FG = COLORS['text']
+    PLACEHOLDER_FG = COLORS['text_secondary']
+    
     def __init__(self, parent, placeholder="", **kwargs):
         super().__init__(
             parent,
@@ -227,7 +488,7 @@ class ModernEntry(tk.Entry):
         
         if placeholder:
             self.insert(0, placeholder)
-            self.config(fg=COLORS['text_secondary'])
+            self.config(fg=self.PLACEHOLDER_FG)
             self.placeholder_active = True
             
             self.bind('<FocusIn>', self.on_focus_in)
@@ -236,15 +497,22 @@ class ModernEntry(tk.Entry):
     def on_focus_in(self, e):
         if self.placeholder_active:
             self.delete(0, tk.END)
-            self.config(fg=COLORS['text'])
+            self.config(fg=self.TEXT_FG)
             self.placeholder_active = False
     
     def on_focus_out(self, e):
         if not self.get():
             self.insert(0, self.placeholder)
-            self.config(fg=COLORS['text_secondary'])
+            self.config(fg=self.PLACEHOLDER_FG)
             self.placeholder_active = True
     
+    def clear(self):
+        self.delete(0, tk.END)
+        self.placeholder_active = False
+        self.config(fg=self.TEXT_FG)
+        if self.placeholder:
+            self.on_focus_out(None)
+    
     def get_value(self):
         if self.placeholder_active:
             return ""
@@ -260,18 +528,48 @@ class LibraryGUI:
         self.root.geometry("1200x700")
         self.root.configure(bg=COLORS['bg_dark'])
         
-        self.manager = LibraryManager()
+        self.manager = LibraryManager(root)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Configure root grid
         self.root.grid_rowconfigure(1, weight=1)
         self.root.grid_columnconfigure(1, weight=1)
         
+        self._configure_styles()
         self.create_header()
         self.create_sidebar()
         self.create_main_area()
         
         # Show initial view
         self.show_all_items()
+        
+        # The background load may already be done; otherwise wait for it
+        if self.manager.poll_loaded():
+            self.refresh_tree()
+            self.update_stats()
+        else:
+            self.show_loading()
+    
+    def _configure_styles(self):
+        # ttk styles are global to the app, so configure them only once
+        style = ttk.Style()
+        style.theme_use('default')
+        style.configure(
+            'Treeview',
+            background=COLORS['bg_light'],
+            foreground=COLORS['text'],
+            fieldbackground=COLORS['bg_light'],
+            borderwidth=0,
+            font=('Segoe UI', 10)
+        )
+        style.configure('Treeview.Heading', font=('Segoe UI', 11, 'bold'))
+        style.map('Treeview', background=[('selected', COLORS['accent'])])
+    
+    def on_close(self):
+        try:
+            self.manager.flush_if_dirty(wait=True)
+        finally:
+            self.root.destroy()
     
     def create_header(self):
         header = tk.Frame(self.root, bg=COLORS['bg_medium'], height=80)
@@ -291,8 +589,7 @@ class LibraryGUI:
         stats_frame = tk.Frame(header, bg=COLORS['bg_medium'])
         stats_frame.pack(side=tk.RIGHT, padx=30)
         
-        total_items = len(self.manager.get_all_items())
-        borrowed = sum(1 for item in self.manager.get_all_items() if item.is_borrowed)
+        total_items, borrowed = self.manager.get_stats()
         
         self.stats_label = tk.Label(
             stats_frame,
@@ -304,8 +601,7 @@ class LibraryGUI:
         self.stats_label.pack()
     
     def update_stats(self):
-        total_items = len(self.manager.get_all_items())
-        borrowed = sum(1 for item in self.manager.get_all_items() if item.is_borrowed)
+        total_items, borrowed = self.manager.get_stats()
         self.stats_label.config(
             text=f"Total: {total_items} | Available: {total_items - borrowed} | Borrowed: {borrowed}"
         )
@@ -325,41 +621,31 @@ class LibraryGUI:
             ("🗑️ Remove Item", self.show_remove_item),
         ]
         
-        for i, (text, command) in enumerate(buttons):
-            btn = tk.Button(
-                sidebar,
-                text=text,
-                command=command,
-                bg=COLORS['bg_light'],
-                fg=COLORS['text'],
-                font=('Segoe UI', 11),
-                relief=tk.FLAT,
-                cursor='hand2',
-                anchor='w',
-                padx=20,
-                pady=15
-            )
-            btn.pack(fill=tk.X, padx=10, pady=5)
-            
-            # Hover effects
-            btn.bind('<Enter>', lambda e, b=btn: b.config(bg=COLORS['accent']))
-            btn.bind('<Leave>', lambda e, b=btn: b.config(bg=COLORS['bg_light']))
+        for text, command in buttons:
+            SidebarButton(sidebar, text, command).pack(fill=tk.X, padx=10, pady=5)
     
     def create_main_area(self):
         self.main_area = tk.Frame(self.root, bg=COLORS['bg_dark'])
         self.main_area.grid(row=1, column=1, sticky='nsew', padx=20, pady=20)
         self.main_area.grid_rowconfigure(0, weight=1)
         self.main_area.grid_columnconfigure(0, weight=1)
+        
+        # Every view is built once and switched with grid/grid_remove
+        self.current_view = None
+        self.views = {
+            'all_items': self.build_all_items_view(),
+            'add_book': self.build_add_book_view(),
+            'add_journal': self.build_add_journal_view(),
+            'search': self.build_search_view(),
+            'borrow_return': self.build_borrow_return_view(),
+            'remove_item': self.build_remove_item_view(),
+        }
     
-    def clear_main_area(self):
-        for widget in self.main_area.winfo_children():
-            widget.destroy()
-    
-    def show_all_items(self):
-        self.clear_main_area()
+    def build_all_items_view(self):
+        view = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
         
         title = tk.Label(
-            self.main_area,
+            view,
             text="Library Inventory",
             font=('Segoe UI', 20, 'bold'),
             bg=COLORS['bg_dark'],
@@ -368,7 +654,7 @@ class LibraryGUI:
         title.pack(pady=(0, 20))
         
         # Create treeview
-        tree_frame = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
+        tree_frame = tk.Frame(view, bg=COLORS['bg_dark'])
         tree_frame.pack(fill=tk.BOTH, expand=True)
         
         # Scrollbar
@@ -402,50 +688,109 @@ class LibraryGUI:
         tree.column('Info', width=200)
         tree.column('Status', width=100, anchor='center')
         
-        # Style
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure(
-            'Treeview',
-            background=COLORS['bg_light'],
-            foreground=COLORS['text'],
-            fieldbackground=COLORS['bg_light'],
-            borderwidth=0,
-            font=('Segoe UI', 10)
-        )
-        style.configure('Treeview.Heading', font=('Segoe UI', 11, 'bold'))
-        style.map('Treeview', background=[('selected', COLORS['accent'])])
-        
-        # Populate data
-        items = self.manager.get_all_items()
-        for item in items:
-            info = item.to_dict()
-            if info['type'] == 'BOOK':
-                detail = info['author']
-            else:
-                detail = info['publisher']
-            
-            status = 'Borrowed' if item.is_borrowed else 'Available'
-            tag = 'borrowed' if item.is_borrowed else 'available'
-            
-            tree.insert('', tk.END, values=(
-                info['id'],
-                info['type'],
-                info['title'],
-                detail,
-                status
-            ), tags=(tag,))
-        
         tree.tag_configure('borrowed', foreground=COLORS['warning'])
         tree.tag_configure('available', foreground=COLORS['success'])
         
         tree.pack(fill=tk.BOTH, expand=True)
+        self.tree = tree
+        self.refresh_tree()
+        
+        return view, []
+    
+    def _show_view(self, name):
+        view, entries = self.views[name]
+        if self.current_view is not None:
+            self.current_view.grid_remove()
+        
+        for entry in entries:
+            entry.clear()
+        
+        view.grid(row=0, column=0, sticky='nsew')
+        self.current_view = view
+    
+    def show_all_items(self):
+        # Rows are kept in sync by the mutation handlers, no repopulation needed
+        self._show_view('all_items')
     
     def show_add_book(self):
-        self.clear_main_area()
+        self._show_view('add_book')
+    
+    def show_add_journal(self):
+        self._show_view('add_journal')
+    
+    def show_search(self):
+        self._show_view('search')
+        for widget in self.search_results_frame.winfo_children():
+            widget.destroy()
+    
+    def show_borrow_return(self):
+        self._show_view('borrow_return')
+    
+    def show_remove_item(self):
+        self._show_view('remove_item')
+    
+    def refresh_tree(self):
+        tree = self.tree
+        tree.delete(*tree.get_children())
+        
+        insert = tree.insert
+        for item in self.manager.inventory.values():
+            values, tags = self._tree_row(item)
+            insert('', tk.END, iid=item.id, values=values, tags=tags)
+    
+    # Tree rows use the item ID as their iid, so single rows can be updated in place
+    def _insert_tree_row(self, item):
+        values, tags = self._tree_row(item)
+        self.tree.insert('', tk.END, iid=item.id, values=values, tags=tags)
+    
+    def _update_tree_row(self, item):
+        if self.tree.exists(item.id):
+            values, tags = self._tree_row(item)
+            self.tree.item(item.id, values=values, tags=tags)
+    
+    def _delete_tree_row(self, item_id):
+        if self.tree.exists(item_id):
+            self.tree.delete(item_id)
+    
+    def show_loading(self):
+        view, _ = self.views['all_items']
+        self.loading_label = tk.Label(
+            view,
+            text="Loading library...",
+            font=('Segoe UI', 12),
+            bg=COLORS['bg_dark'],
+            fg=COLORS['text_secondary']
+        )
+        self.loading_label.pack(before=self.tree.master, pady=(0, 10))
+        self.root.after(LOAD_POLL_MS, self.check_loaded)
+    
+    def check_loaded(self):
+        if not self.manager.poll_loaded():
+            self.root.after(LOAD_POLL_MS, self.check_loaded)
+            return
+        
+        self.loading_label.destroy()
+        self.refresh_tree()
+        self.update_stats()
+    
+    def _tree_row(self, item):
+        if isinstance(item, Book):
+            detail = item.author
+        else:
+            detail = item.publisher
+        
+        if item.is_borrowed:
+            status, tag = 'Borrowed', 'borrowed'
+        else:
+            status, tag = 'Available', 'available'
+        
+        return (item.id, item.get_type(), item.title, detail, status), (tag,)
+    
+    def build_add_book_view(self):
+        view = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
         
         title = tk.Label(
-            self.main_area,
+            view,
             text="Add New Book",
             font=('Segoe UI', 20, 'bold'),
             bg=COLORS['bg_dark'],
@@ -453,7 +798,7 @@ class LibraryGUI:
         )
         title.pack(pady=(0, 30))
         
-        form_frame = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
+        form_frame = tk.Frame(view, bg=COLORS['bg_dark'])
         form_frame.pack(pady=20)
         
         # Form fields
@@ -478,10 +823,10 @@ class LibraryGUI:
         
         def add_book():
             try:
-                item_id = int(id_entry.get_value())
+                item_id = parse_int(id_entry.get_value())
                 title = title_entry.get_value()
                 author = author_entry.get_value()
-                pages = int(pages_entry.get_value())
+                pages = parse_int(pages_entry.get_value())
                 
                 if not all([title, author]):
                     messagebox.showerror("Error", "Please fill all fields")
@@ -491,6 +836,7 @@ class LibraryGUI:
                 success, message = self.manager.add_item(book)
                 
                 if success:
+                    self._insert_tree_row(book)
                     messagebox.showinfo("Success", message)
                     self.update_stats()
                     self.show_all_items()
@@ -502,12 +848,14 @@ class LibraryGUI:
         ModernButton(form_frame, "Add Book", add_book).grid(
             row=len(labels_text), column=1, pady=30, sticky='ew', padx=10
         )
+        
+        return view, fields
     
-    def show_add_journal(self):
-        self.clear_main_area()
+    def build_add_journal_view(self):
+        view = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
         
         title = tk.Label(
-            self.main_area,
+            view,
             text="Add New Journal",
             font=('Segoe UI', 20, 'bold'),
             bg=COLORS['bg_dark'],
@@ -515,7 +863,7 @@ class LibraryGUI:
         )
         title.pack(pady=(0, 30))
         
-        form_frame = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
+        form_frame = tk.Frame(view, bg=COLORS['bg_dark'])
         form_frame.pack(pady=20)
         
         # Form fields
@@ -540,10 +888,10 @@ class LibraryGUI:
         
         def add_journal():
             try:
-                item_id = int(id_entry.get_value())
+                item_id = parse_int(id_entry.get_value())
                 title = title_entry.get_value()
                 publisher = publisher_entry.get_value()
-                volume = int(volume_entry.get_value())
+                volume = parse_int(volume_entry.get_value())
                 
                 if not all([title, publisher]):
                     messagebox.showerror("Error", "Please fill all fields")
@@ -553,6 +901,7 @@ class LibraryGUI:
                 success, message = self.manager.add_item(journal)
                 
                 if success:
+                    self._insert_tree_row(journal)
                     messagebox.showinfo("Success", message)
                     self.update_stats()
                     self.show_all_items()
@@ -564,12 +913,14 @@ class LibraryGUI:
         ModernButton(form_frame, "Add Journal", add_journal).grid(
             row=len(labels_text), column=1, pady=30, sticky='ew', padx=10
         )
+        
+        return view, fields
     
-    def show_search(self):
-        self.clear_main_area()
+    def build_search_view(self):
+        view = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
         
         title = tk.Label(
-            self.main_area,
+            view,
             text="Search Items",
             font=('Segoe UI', 20, 'bold'),
             bg=COLORS['bg_dark'],
@@ -577,14 +928,15 @@ class LibraryGUI:
         )
         title.pack(pady=(0, 20))
         
-        search_frame = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
+        search_frame = tk.Frame(view, bg=COLORS['bg_dark'])
         search_frame.pack(pady=20)
         
         search_entry = ModernEntry(search_frame, width=40)
         search_entry.pack(side=tk.LEFT, padx=10, ipady=8)
         
-        results_frame = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
+        results_frame = tk.Frame(view, bg=COLORS['bg_dark'])
         results_frame.pack(fill=tk.BOTH, expand=True, pady=20)
+        self.search_results_frame = results_frame
         
         def perform_search():
             keyword = search_entry.get_value()
@@ -631,12 +983,14 @@ class LibraryGUI:
                     label.pack(fill=tk.X, padx=15, pady=10)
         
         ModernButton(search_frame, "Search", perform_search).pack(side=tk.LEFT)
+        
+        return view, [search_entry]
     
-    def show_borrow_return(self):
-        self.clear_main_area()
+    def build_borrow_return_view(self):
+        view = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
         
         title = tk.Label(
-            self.main_area,
+            view,
             text="Borrow / Return Item",
             font=('Segoe UI', 20, 'bold'),
             bg=COLORS['bg_dark'],
@@ -644,7 +998,7 @@ class LibraryGUI:
         )
         title.pack(pady=(0, 30))
         
-        form_frame = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
+        form_frame = tk.Frame(view, bg=COLORS['bg_dark'])
         form_frame.pack(pady=20)
         
         label = tk.Label(
@@ -661,10 +1015,11 @@ class LibraryGUI:
         
         def toggle_borrow():
             try:
-                item_id = int(id_entry.get_value())
+                item_id = parse_int(id_entry.get_value())
                 success, message = self.manager.toggle_borrow(item_id)
                 
                 if success:
+                    self._update_tree_row(self.manager.get_item(item_id))
                     messagebox.showinfo("Success", message)
                     self.update_stats()
                     id_entry.delete(0, tk.END)
@@ -676,12 +1031,14 @@ class LibraryGUI:
         ModernButton(form_frame, "Toggle Status", toggle_borrow).grid(
             row=1, column=1, pady=30, sticky='ew', padx=10
         )
+        
+        return view, [id_entry]
     
-    def show_remove_item(self):
-        self.clear_main_area()
+    def build_remove_item_view(self):
+        view = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
         
         title = tk.Label(
-            self.main_area,
+            view,
             text="Remove Item",
             font=('Segoe UI', 20, 'bold'),
             bg=COLORS['bg_dark'],
@@ -689,7 +1046,7 @@ class LibraryGUI:
         )
         title.pack(pady=(0, 30))
         
-        form_frame = tk.Frame(self.main_area, bg=COLORS['bg_dark'])
+        form_frame = tk.Frame(view, bg=COLORS['bg_dark'])
         form_frame.pack(pady=20)
         
         label = tk.Label(
@@ -706,13 +1063,14 @@ class LibraryGUI:
         
         def remove_item():
             try:
-                item_id = int(id_entry.get_value())
+                item_id = parse_int(id_entry.get_value())
                 
                 # Confirmation dialog
                 if messagebox.askyesno("Confirm", f"Are you sure you want to remove item ID {item_id}?"):
                     success, message = self.manager.remove_item(item_id)
                     
                     if success:
+                        self._delete_tree_row(item_id)
                         messagebox.showinfo("Success", message)
                         self.update_stats()
                         self.show_all_items()
@@ -724,6 +1082,8 @@ class LibraryGUI:
         ModernButton(form_frame, "Remove Item", remove_item, bg_color=COLORS['danger']).grid(
             row=1, column=1, pady=30, sticky='ew', padx=10
         )
+        
+        return view, [id_entry]
 
 # ==========================================
 # Main Execution